@@ -1,8 +1,10 @@
 import dearpygui.dearpygui as dpg
 import sys
 import os
+import time
 
 from source.editor import PhotoGraphEditor
+from source.recorder import recorder
 
 # start helper functions
 def setup_fonts():
@@ -19,13 +21,13 @@ def setup_fonts():
         print(f"Error setting up fonts: {e}")
         sys.exit(1)
     
-def setup_menus():
+def setup_menus(editor):
     """Application menus setup"""
     with dpg.menu_bar():
         with dpg.menu(tag="file", label="File"):
-            dpg.add_menu_item(label="New Project", callback=None)
-            dpg.add_menu_item(label="Open Project", callback=None)
-            dpg.add_menu_item(label="Save Project", callback=None)
+            dpg.add_menu_item(label="New Project", callback=lambda: editor.new_project())
+            dpg.add_menu_item(label="Open Project", callback=lambda: editor._show_project_dialog(save=False))
+            dpg.add_menu_item(label="Save Project", callback=lambda: editor._show_project_dialog(save=True))
             dpg.add_separator()
             dpg.add_menu_item(label="Exit", callback=lambda: dpg.stop_dearpygui())
 
@@ -37,7 +39,18 @@ def setup_menus():
         with dpg.menu(tag="development", label="Dev"):
             dpg.add_menu_item(tag="dev", label="DPG Docs", callback=lambda: dpg.show_documentation())
             dpg.add_menu_item(label="Debug Info", callback=lambda: dpg.show_debug())
+            dpg.add_separator()
+            dpg.add_menu_item(label="Start Recording", callback=lambda: editor.start_recording())
+            dpg.add_menu_item(label="Stop Recording", callback=stop_recording)
+
 
+def stop_recording():
+    """Stop recording and save the session for source.replay."""
+    if not recorder.active:
+        return
+    recorder.stop()
+    path = recorder.save(f"session_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+    print(f"Session saved to {path} ({len(recorder.events)} events)")
 
 def show_about():
     """Show about dialog."""
@@ -65,7 +78,7 @@ def main():
         editor = PhotoGraphEditor()
 
         with dpg.window(tag='photoGraphMain', menubar=True, no_title_bar=True, no_move=True, no_resize=True, no_close=True):
-            setup_menus()
+            setup_menus(editor)
             
             editor._initialize()
 
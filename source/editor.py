@@ -11,6 +11,8 @@ from source.nodes.submodules.monochrome import MonochromeNode
 from source.nodes.submodules.rgb import RGBNode
 
 from source.nodes.core import Link, update
+from source.recorder import attribute_ref, recorder
+from source import project
 
 class PhotoGraphEditor:
     """Main class for the PhotoGraph editor."""
@@ -65,6 +67,7 @@ class PhotoGraphEditor:
 
     def _on_link_created(self, sender, app_data):
         """Handle node link creation."""
+        recorder.record("link", source=attribute_ref(app_data[0]), target=attribute_ref(app_data[1]))
         for link in update.node_links:
             if link.source == app_data[0]:
                 try:
@@ -79,6 +82,10 @@ class PhotoGraphEditor:
         update.update_output()
 
     def _on_link_deleted(self, sender, app_data) -> None:
+        for link in update.node_links:
+            if link.id == app_data:
+                recorder.record("unlink", source=attribute_ref(link.source), target=attribute_ref(link.target))
+                break
         dpg.delete_item(app_data)
         for link in update.node_links:
             if link.id == app_data:
@@ -88,6 +95,56 @@ class PhotoGraphEditor:
         update.update_path()
         update.update_output()
 
+    def new_project(self) -> None:
+        """Reset the editor to the startup graph."""
+        project.clear(self)
+        dpg.push_container_stack(self.tag)
+        try:
+            for module in self.submodules[1:-1]:
+                module.initialize()
+        finally:
+            dpg.pop_container_stack()
+        dpg.get_item_user_data("Input").restore(None)
+        update.update_path()
+        update.update_output()
+        recorder.record("snapshot", **self.snapshot())
+
+    def open_project(self, file_path) -> None:
+        """Load a project file into the editor."""
+        if project.load(self, file_path):
+            recorder.record("snapshot", **self.snapshot())
+
+    def snapshot(self) -> Dict:
+        """Current graph state, as recorded at the start of a session."""
+        return project.collect(self).model_dump()
+
+    def start_recording(self) -> None:
+        """Record editor events, starting from the current graph state."""
+        recorder.start(self.snapshot())
+
+    def save_project(self, file_path) -> None:
+        """Save the editor graph to a project file."""
+        file_path = project.save(self, file_path)
+        print(f"Project saved to {file_path}")
+
+    def _show_project_dialog(self, save: bool) -> None:
+        """Show file dialog for opening or saving a project."""
+        dialog_tag = "project_dialog_id"
+
+        if dpg.does_item_exist(dialog_tag):
+            dpg.delete_item(dialog_tag)
+
+        callback = self.save_project if save else self.open_project
+        with dpg.file_dialog(
+            directory_selector=False,
+            show=True,
+            callback=lambda sender, app_data: callback(app_data["file_path_name"]),
+            tag=dialog_tag,
+            width=700,
+            height=400
+        ):
+            dpg.add_file_extension(project.EXTENSION)
+
     def _handle_right_click(self, sender, app_data) -> None:
         """Handle right mouse click events."""
         # TODO: Implement context menu logic
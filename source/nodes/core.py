@@ -1,4 +1,5 @@
 from contextlib import suppress
+import time
 import dearpygui.dearpygui as dpg
 from typing import Optional
 from PIL import Image
@@ -6,6 +7,8 @@ from pydantic import BaseModel
 import numpy as np
 
 from source.nodes.io import output
+from source.nodes.planner import plan
+from source.recorder import recorder
 
 def available_pos() -> Optional[list[int]]:
     x, y = dpg.get_mouse_pos(local=False)
@@ -13,6 +16,13 @@ def available_pos() -> Optional[list[int]]:
 
 class NodeCore:
     """Base class for all nodes in the graph."""
+
+    # planner hints, see source.nodes.planner
+    idempotent = False
+    # seconds per pixel, refined every time the node runs. The subclass
+    # defaults are rounded timings of run() on a 3000x2000 RGBA image.
+    cost = 0.0
+
     def __init__(self):
         self.counter = 0
         self.update_output = update.update_output
@@ -23,6 +33,10 @@ class NodeCore:
     def end(self, tag, history):
         self.counter += 1
 
+    def is_identity(self, tag) -> bool:
+        """Whether the node leaves the image untouched with its current settings."""
+        return False
+
 class Link(BaseModel):
     """Model for a link between nodes."""
     source: int
@@ -39,6 +53,8 @@ class Update:
     def __init__(self):
         self.path = []
         self.node_links = []
+        self.plan = None
+        self.timings = {}
 
     def update_path(self):
         self.path.clear()
@@ -67,8 +83,19 @@ class Update:
             if not found:
                 break
 
+        for tag in [tag for tag in self.timings if not dpg.does_item_exist(tag)]:
+            del self.timings[tag]
+
+    def reaches_output(self) -> bool:
+        """Whether the current path ends at the Output node."""
+        try:
+            return dpg.get_item_user_data(self.path[-1]).name == "Output"
+        except IndexError:
+            return False
+
     def update_output(self, sender=None, app_data=None, history=True):
-        if sender and app_data:
+        if sender is not None and app_data is not None:
+            recorder.record("slider", item=dpg.get_item_alias(sender) or sender, value=app_data)
             try:
                 node = dpg.get_item_info(dpg.get_item_info(sender)["parent"])["parent"]
                 module = dpg.get_item_user_data(node)
@@ -108,16 +135,26 @@ class Update:
             return
         
         img_size = image.size
-        for node in self.path[1:-1]:
-            tag = dpg.get_item_alias(node)
-            node = dpg.get_item_user_data(node)
+        steps = [(dpg.get_item_alias(node), dpg.get_item_user_data(node)) for node in self.path[1:-1]]
+        self.plan = plan(steps, self.timings, image.width * image.height)
+        for tag, node in self.plan.steps:
+            start = time.perf_counter()
+            pixels = image.width * image.height
             image = node.run(image, tag)
-
-        dpg.delete_item(output.image)
-        with suppress(SystemError):
-            dpg.remove_alias(output.image)
-
-        if not isinstance(output.image, str):
+            self.timings[tag] = time.perf_counter() - start
+            node.cost = self.timings[tag] / pixels
+        if image is input_node.current_image:
+            # every node was planned away, don't thumbnail the source in place
+            image = image.copy()
+        self.show_output(output, image, img_size)
+
+    def show_output(self, output, image: Image.Image, img_size=None):
+        """Replace the Output texture with image, keeping it as the downloadable result."""
+        if isinstance(output.image, str):
+            dpg.delete_item(output.image)
+            with suppress(SystemError):
+                dpg.remove_alias(output.image)
+        else:
             output.image = "output_0"
         counter = output.image.split("_")[-1]
         output.image = "output_" + str(int(counter) + 1)
@@ -6,6 +6,7 @@ import logging
 import numpy as np
 
 from source.nodes.core import NodeCore, update
+from source.recorder import recorder
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ class InputNode(NodeCore):
     def __init__(self):
         self._protected = True
         self._current_image: Optional[Image.Image] = None
+        self._path: Optional[Path] = None
         self._texture_tag = f"input_texture"
         self._image_tag = f"input_image"
         self._container_tag = f"input_image_container"
@@ -64,22 +66,26 @@ class InputNode(NodeCore):
     def _handle_file_selection(self, sender, app_data):
         """Handle file selection from dialog."""
         file_path = Path(app_data['file_path_name'])
+        recorder.record("load", path=str(file_path))
 
         try:
             self._current_image = Image.open(file_path)
+            self._path = file_path
             self._display_image()
+            self._invalidate_output()
             logger.info(f"Image loaded: {file_path}")
         except Exception as e:
             logger.error(f"Failed to open image {file_path}: {e}")
         # update.update_output()
 
-    def _display_image(self):
-        """Display the loaded image in the node."""
-        if not self._current_image:
+    def _display_image(self, image: Optional[Image.Image] = None):
+        """Display the loaded image, or a stand-in for it, in the node."""
+        image = image or self._current_image
+        if not image:
             return
 
         # Prepare display image
-        display_image = self._current_image.copy()
+        display_image = image.copy()
         display_image.thumbnail(self.MAX_DISPLAY_SIZE, Image.Resampling.LANCZOS)
         
         if display_image.mode != 'RGBA':
@@ -107,6 +113,31 @@ class InputNode(NodeCore):
 
         dpg.add_image(self._texture_tag, tag=self._image_tag, parent=self._container_tag)
 
+    def restore(self, file_path: Optional[str], proxy: Optional[Image.Image] = None):
+        """Restore a saved image, showing the proxy instead of decoding the source."""
+        self._path = Path(file_path) if file_path else None
+        self._current_image = None
+        self._invalidate_output()
+        if self._path:
+            try:
+                # Image.open only reads the header, pixels are decoded on first use
+                self._current_image = Image.open(self._path)
+            except Exception as e:
+                logger.error(f"Failed to open image {self._path}: {e}")
+        if self._current_image is None and proxy is not None:
+            logger.warning(f"Using the project proxy in place of {self._path}")
+            self._current_image = proxy
+
+        for tag in [self._texture_tag, self._image_tag]:
+            if dpg.does_item_exist(tag):
+                dpg.delete_item(tag)
+        self._display_image(proxy)
+
+    def _invalidate_output(self):
+        """Drop the last render, it was made from the previous image."""
+        if dpg.does_item_exist("Output"):
+            dpg.get_item_user_data("Output").pillow_image = None
+
     def process(self, input_image: Optional[Image.Image], node_tag: str) -> Optional[Image.Image]:
         """Process method for node graph execution."""
         return self._current_image
@@ -116,6 +147,11 @@ class InputNode(NodeCore):
         """Get the currently loaded image."""
         return self._current_image
 
+    @property
+    def path(self) -> Optional[Path]:
+        """Get the path the current image was loaded from."""
+        return self._path
+
     @property
     def has_image(self) -> bool:
         """Check if an image is currently loaded."""
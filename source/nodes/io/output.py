@@ -69,6 +69,10 @@ class OutputNode:
         dpg.show_item("output_save_dialog")
 
     def _save_image_callback(self, sender, app_data):
+        if self.pillow_image is None:
+            # opened from a project, only the preview is loaded so far
+            from source.nodes.core import update
+            update.update_output()
         if self.pillow_image is not None and "file_path_name" in app_data:
             self.pillow_image.save(app_data["file_path_name"])
             print(f"Image saved to {app_data['file_path_name']}")
\ No newline at end of file
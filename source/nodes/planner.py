@@ -0,0 +1,73 @@
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class Plan:
+    """Execution plan produced for the nodes between Input and Output."""
+
+    def __init__(self, steps: List[Tuple[str, object]]):
+        self.original = [tag for tag, _ in steps]
+        self.steps = list(steps)
+        self.skipped: List[Tuple[str, str]] = []
+        self.saved = 0.0
+        self.measured = 0
+        self.elapsed = 0.0
+
+    @property
+    def tags(self) -> List[str]:
+        """Aliases of the nodes that will actually run, in order."""
+        return [tag for tag, _ in self.steps]
+
+    def __str__(self):
+        lines = [f"Plan: {' -> '.join(self.original) or '(empty)'}"]
+        lines.append(f"  runs: {' -> '.join(self.tags) or '(nothing)'}")
+        for tag, reason in self.skipped:
+            lines.append(f"  skipped {tag}: {reason}")
+        lines.append(
+            f"  estimated time saved: {self.saved * 1000:.2f} ms "
+            f"({self.measured} of {len(self.skipped)} skipped nodes measured, rest from per-pixel cost)"
+        )
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return self.__str__()
+
+def plan(
+    steps: List[Tuple[str, object]],
+    timings: Optional[Dict[str, float]] = None,
+    pixels: int = 0,
+) -> Plan:
+    """Build an execution plan for a chain of (alias, module) pairs.
+
+    Identity nodes are dropped and repeated idempotent nodes are collapsed.
+    ``timings`` holds the last measured run time of each alias and is used to
+    estimate the time saved, skipped nodes that never ran are estimated from
+    their per-pixel ``cost``.
+    """
+    start = time.perf_counter()
+    result = Plan(steps)
+    timings = timings or {}
+
+    kept = []
+    for tag, module in result.steps:
+        if module.is_identity(tag):
+            result.skipped.append((tag, "identity"))
+            continue
+        if kept and module.idempotent and type(kept[-1][1]) is type(module):
+            result.skipped.append((tag, f"repeats {kept[-1][0]}"))
+            continue
+        kept.append((tag, module))
+
+    result.steps = kept
+    modules = dict(steps)
+    for tag, _ in result.skipped:
+        if tag in timings:
+            result.saved += timings[tag]
+            result.measured += 1
+        else:
+            result.saved += modules[tag].cost * pixels
+    result.elapsed = time.perf_counter() - start
+    logger.debug(result)
+    return result
@@ -8,15 +8,17 @@ class BrightnessNode(NodeCore):
     name = "Brightness"
     tooltip = "Adjust brightness"
 
+    cost = 7.7e-09
+
     def __init__(self):
         super().__init__()
 
-    def initialize(self, history=True):
+    def initialize(self, history=True, pos=None):
         with dpg.node(
             parent="MainNodeEditor",
             tag="brightness_" + str(self.counter),
             label="Brightness",
-            pos=available_pos(),
+            pos=pos or available_pos(),
             user_data=self,
         ):
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Input):
@@ -37,6 +39,10 @@ class BrightnessNode(NodeCore):
         self.settings[tag] = {"brightness_percentage_" + str(self.counter): 1}
         self.end(tag, history)
 
+    def is_identity(self, tag) -> bool:
+        tag = tag.split("_")[-1]
+        return self.settings["brightness_" + tag]["brightness_percentage_" + tag] == 25
+
     def run(self, image: Image.Image, tag: str) -> Image.Image:
         tag = tag.split("_")[-1]
         percent = self.settings["brightness_" + tag]["brightness_percentage_" + tag]
@@ -6,15 +6,18 @@ class MonochromeNode(NodeCore):
     name = "Monochrome"
     tooltip = "Convert image to monochrome (grayscale)"
 
+    idempotent = True
+    cost = 3.0e-09
+
     def __init__(self):
         super().__init__()
 
-    def initialize(self, history=True):
+    def initialize(self, history=True, pos=None):
         with dpg.node(
             parent="MainNodeEditor",
             tag="monochrome_" + str(self.counter),
             label="Monochrome",
-            pos=available_pos(),
+            pos=pos or available_pos(),
             user_data=self,
         ):
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Input):
@@ -8,15 +8,17 @@ class RGBNode(NodeCore):
     name = "RGB"
     tooltip = "Adjust RGB channels (decrease each color)"
 
+    cost = 1.6e-08
+
     def __init__(self):
         super().__init__()
 
-    def initialize(self, history=True):
+    def initialize(self, history=True, pos=None):
         with dpg.node(
             parent="MainNodeEditor",
             tag="rgb_" + str(self.counter),
             label="RGB",
-            pos=available_pos(),
+            pos=pos or available_pos(),
             user_data=self,
         ):
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Input):
@@ -61,6 +63,14 @@ class RGBNode(NodeCore):
         }
         self.end(tag, history)
 
+    def _offsets(self, tag):
+        tag_id = tag.split("_")[-1]
+        settings = self.settings["rgb_" + tag_id]
+        return [settings["rgb_" + c + "_" + tag_id] for c in "rgb"]
+
+    def is_identity(self, tag) -> bool:
+        return not any(self._offsets(tag))
+
     def run(self, image: Image.Image, tag: str) -> Image.Image:
         tag_id = tag.split("_")[-1]
         r_decrease = self.settings["rgb_" + tag_id]["rgb_r_" + tag_id]
@@ -8,15 +8,17 @@ class RotateNode(NodeCore):
     name = "Rotate"
     tooltip = "Rotate image"
 
+    cost = 8.0e-09
+
     def __init__(self):
         super().__init__()
 
-    def initialize(self, history=True):
+    def initialize(self, history=True, pos=None):
         with dpg.node(
             parent="MainNodeEditor",
             tag="rotate_" + str(self.counter),
             label="Rotate",
-            pos=available_pos(),
+            pos=pos or available_pos(),
             user_data=self,
         ):
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Input):
@@ -37,6 +39,10 @@ class RotateNode(NodeCore):
         self.settings[tag] = {"rotate_degrees_" + str(self.counter): 0}
         self.end(tag, history)
 
+    def is_identity(self, tag) -> bool:
+        tag_id = tag.split("_")[-1]
+        return self.settings["rotate_" + tag_id]["rotate_degrees_" + tag_id] % 360 == 0
+
     def run(self, image: Image.Image, tag: str) -> Image.Image:
         tag_id = tag.split("_")[-1]
         degrees = self.settings["rotate_" + tag_id]["rotate_degrees_" + tag_id]
@@ -0,0 +1,222 @@
+import dearpygui.dearpygui as dpg
+import logging
+import struct
+import zlib
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from PIL import Image
+from pydantic import BaseModel
+
+from source.nodes.core import Link, update
+from source.recorder import attribute_ref, resolve_ref
+
+logger = logging.getLogger(__name__)
+
+# file layout: header, then (section tag, payload length, payload) until EOF
+MAGIC = b"PHGR"
+VERSION = 1
+HEADER = struct.Struct(">4sB")
+SECTION = struct.Struct(">4sI")
+IMAGE = struct.Struct(">II")
+
+EXTENSION = ".phg"
+PROXY_SIZE = (512, 512)
+RENDER_SIZE = (450, 450)
+FIXED_NODES = ("Input", "Output")
+
+class NodeState(BaseModel):
+    """Model for a saved node."""
+    tag: str
+    kind: str
+    pos: List[int]
+    settings: Dict[str, Any] = {}
+
+class Project(BaseModel):
+    """Model for a saved graph."""
+    source: Optional[str] = None
+    nodes: List[NodeState] = []
+    links: List[Tuple[str, str]] = []
+
+def _pack_image(image: Image.Image, size) -> bytes:
+    image = image.copy()
+    image.thumbnail(size, Image.Resampling.LANCZOS)
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return IMAGE.pack(image.width, image.height) + zlib.compress(image.tobytes())
+
+def _unpack_image(payload: bytes) -> Image.Image:
+    width, height = IMAGE.unpack_from(payload)
+    return Image.frombytes("RGBA", (width, height), zlib.decompress(payload[IMAGE.size:]))
+
+def collect(editor) -> Project:
+    """Snapshot the editor graph."""
+    project = Project()
+    for module in editor.submodules:
+        if module.name in FIXED_NODES:
+            project.nodes.append(NodeState(tag=module.name, kind=module.name, pos=dpg.get_item_pos(module.name)))
+            continue
+        for tag, settings in module.settings.items():
+            if dpg.does_item_exist(tag):
+                project.nodes.append(NodeState(tag=tag, kind=module.name, pos=dpg.get_item_pos(tag), settings=settings))
+
+    project.links = [(attribute_ref(link.source), attribute_ref(link.target)) for link in update.node_links]
+    path = dpg.get_item_user_data("Input").path
+    project.source = str(path) if path else None
+    return project
+
+def save(editor, file_path, proxy: bool = True, render: bool = True) -> Path:
+    """Write the editor graph, optionally with a proxy of the source and the last render."""
+    sections = [(b"GRPH", zlib.compress(collect(editor).model_dump_json().encode()))]
+
+    input_node = dpg.get_item_user_data("Input")
+    if proxy and input_node.current_image is not None:
+        sections.append((b"PROX", _pack_image(input_node.current_image, PROXY_SIZE)))
+
+    output = dpg.get_item_user_data("Output")
+    if render and input_node.current_image is not None and update.reaches_output():
+        if output.pillow_image is None:
+            update.update_output()
+        if output.pillow_image is not None and isinstance(output.image, str):
+            sections.append((b"REND", _pack_image(output.pillow_image, RENDER_SIZE)))
+
+    file_path = Path(file_path)
+    with file_path.open("wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION))
+        for tag, payload in sections:
+            file.write(SECTION.pack(tag, len(payload)))
+            file.write(payload)
+    return file_path
+
+def read(file_path) -> Tuple[Project, Optional[Image.Image], Optional[Image.Image]]:
+    """Read a project file into (project, proxy, render)."""
+    data = Path(file_path).read_bytes()
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC or version > VERSION:
+        raise ValueError(f"{file_path} is not a PhotoGraph project (version {VERSION} or older)")
+
+    sections = {}
+    offset = HEADER.size
+    while offset < len(data):
+        tag, length = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+        sections[tag] = data[offset:offset + length]
+        offset += length
+
+    if b"GRPH" not in sections:
+        raise ValueError(f"{file_path} has no graph section")
+    project = Project.model_validate_json(zlib.decompress(sections[b"GRPH"]))
+    proxy = _unpack_image(sections[b"PROX"]) if b"PROX" in sections else None
+    render = _unpack_image(sections[b"REND"]) if b"REND" in sections else None
+    return project, proxy, render
+
+def clear(editor):
+    """Remove every link and every node except Input and Output."""
+    for link in update.node_links:
+        with suppress(SystemError):
+            dpg.delete_item(link.id)
+    update.node_links.clear()
+    update.timings.clear()
+
+    for module in editor.submodules:
+        if module.name in FIXED_NODES:
+            continue
+        for tag in module.settings:
+            if dpg.does_item_exist(tag):
+                dpg.delete_item(tag)
+        module.settings.clear()
+        module.counter = 0
+
+def validate(editor, project: Project):
+    """Raise ValueError if the project can't be rebuilt in this editor."""
+    modules = {module.name for module in editor.submodules}
+    tags = set()
+    for node in project.nodes:
+        if node.kind not in modules:
+            raise ValueError(f"unknown node kind {node.kind!r}")
+        prefix, _, counter = node.tag.rpartition("_")
+        valid = node.tag == node.kind if node.kind in FIXED_NODES else (
+            prefix == node.kind.lower() and counter.isdigit()
+        )
+        if not valid or node.tag in tags:
+            raise ValueError(f"invalid tag {node.tag!r} for a {node.kind} node")
+        tags.add(node.tag)
+
+    for ref in (ref for link in project.links for ref in link):
+        node, _, index = ref.rpartition(":")
+        if node not in tags or not index.isdigit():
+            raise ValueError(f"invalid link reference {ref!r}")
+
+def load(editor, file_path) -> bool:
+    """Rebuild the editor from a project file, returns whether it succeeded.
+
+    On failure the error is logged and the previous graph is put back.
+    """
+    try:
+        project, proxy, render = read(file_path)
+        validate(editor, project)
+    except Exception as e:
+        logger.error(f"Failed to open project {file_path}: {e}")
+        return False
+
+    previous = collect(editor)
+    try:
+        _rebuild(editor, project)
+    except Exception as e:
+        logger.error(f"Failed to open project {file_path}: {e}")
+        _rebuild(editor, previous)
+        update.update_path()
+        update.update_output()
+        return False
+
+    _refresh(project, proxy, render)
+    logger.info(f"Project loaded: {file_path} ({len(project.nodes)} nodes, {len(project.links)} links)")
+    return True
+
+def restore(editor, project: Project, proxy: Optional[Image.Image] = None, render: Optional[Image.Image] = None):
+    """Rebuild the editor from a project in one pass.
+
+    Nodes are created at their saved positions and links are added
+    directly, so the path and output are only refreshed once at the end.
+    An embedded render is shown as is, without decoding the source image.
+    """
+    _rebuild(editor, project)
+    _refresh(project, proxy, render)
+
+def _rebuild(editor, project: Project):
+    modules = {module.name: module for module in editor.submodules}
+    clear(editor)
+    dpg.push_container_stack(editor.tag)
+    try:
+        for node in project.nodes:
+            if node.kind in FIXED_NODES:
+                dpg.set_item_pos(node.kind, node.pos)
+                continue
+            module = modules[node.kind]
+            module.counter = int(node.tag.split("_")[-1])
+            module.initialize(history=False, pos=node.pos)
+            module.settings[node.tag].update(node.settings)
+            for item, value in node.settings.items():
+                dpg.set_value(item, value)
+
+        for module in modules.values():
+            if module.name not in FIXED_NODES:
+                module.counter = max((int(tag.split("_")[-1]) for tag in module.settings), default=-1) + 1
+
+        for source, target in project.links:
+            source, target = resolve_ref(source), resolve_ref(target)
+            link = dpg.add_node_link(source, target)
+            update.node_links.append(Link(source=source, target=target, id=int(link)))
+    finally:
+        dpg.pop_container_stack()
+
+def _refresh(project: Project, proxy: Optional[Image.Image], render: Optional[Image.Image]):
+    dpg.get_item_user_data("Input").restore(project.source, proxy)
+    update.update_path()
+    if render is not None and update.reaches_output():
+        output = dpg.get_item_user_data("Output")
+        update.show_output(output, render, render.size)
+        # the full resolution result is rendered on demand
+        output.pillow_image = None
+    else:
+        update.update_output()
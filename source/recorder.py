@@ -0,0 +1,68 @@
+import dearpygui.dearpygui as dpg
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+class Event(BaseModel):
+    """Model for a recorded editor event."""
+    time: float
+    kind: str
+    data: Dict[str, Any] = {}
+
+    def __str__(self):
+        return f"{self.kind} at {self.time:.3f}s {self.data}"
+
+    def __repr__(self):
+        return self.__str__()
+
+def attribute_ref(attribute) -> str:
+    """Stable reference to a node attribute, e.g. "rotate_0:1"."""
+    node = dpg.get_item_parent(attribute)
+    index = dpg.get_item_children(node, 1).index(attribute)
+    return f"{dpg.get_item_alias(node)}:{index}"
+
+def resolve_ref(ref: str) -> int:
+    """Attribute id for a reference made by attribute_ref."""
+    node, index = ref.rsplit(":", 1)
+    return dpg.get_item_children(node, 1)[int(index)]
+
+class Recorder:
+    """Records editor events into a replayable script."""
+
+    def __init__(self):
+        self.events: List[Event] = []
+        self.active = False
+        self._start = 0.0
+
+    def start(self, snapshot: Optional[Dict[str, Any]] = None):
+        """Start a new recording, from the graph state in snapshot if given."""
+        self.events.clear()
+        self._start = time.perf_counter()
+        self.active = True
+        if snapshot is not None:
+            self.record("snapshot", **snapshot)
+
+    def stop(self):
+        self.active = False
+
+    def record(self, kind: str, **data):
+        if not self.active:
+            return
+        self.events.append(Event(time=time.perf_counter() - self._start, kind=kind, data=data))
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        with path.open("w") as file:
+            for event in self.events:
+                file.write(event.model_dump_json() + "\n")
+        return path
+
+    @staticmethod
+    def load(path) -> List[Event]:
+        with Path(path).open() as file:
+            return [Event.model_validate_json(line) for line in file if line.strip()]
+
+
+
+recorder = Recorder()
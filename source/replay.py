@@ -0,0 +1,177 @@
+import argparse
+import logging
+import time
+from typing import Dict, List
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+from source import project
+from source.editor import PhotoGraphEditor
+from source.nodes.core import update
+from source.recorder import Event, Recorder, resolve_ref
+
+logger = logging.getLogger(__name__)
+
+class Report:
+    """Latency report for a replayed session."""
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.loads = 0
+
+    def add(self, kind: str, latency: float):
+        self.latencies.setdefault(kind, []).append(latency)
+
+    def percentiles(self, kind: str = None) -> Dict[int, float]:
+        """Latency percentiles in seconds for one event kind, or all of them."""
+        values = self.latencies.get(kind, []) if kind else sum(self.latencies.values(), [])
+        if not values:
+            return {}
+        return dict(zip(self.PERCENTILES, np.percentile(values, self.PERCENTILES)))
+
+    def __str__(self):
+        lines = []
+        for kind in [None, *sorted(self.latencies)]:
+            values = self.percentiles(kind)
+            if not values:
+                continue
+            count = len(self.latencies[kind]) if kind else sum(map(len, self.latencies.values()))
+            stats = "  ".join(f"p{p} {v * 1000:.2f} ms" for p, v in values.items())
+            lines.append(f"{kind or 'all':<8} n={count:<5} {stats}")
+        lines.append(
+            f"coalesced: {self.coalesced}  dropped: {self.dropped}  errors: {self.errors}  "
+            f"loads (not timed): {self.loads}"
+        )
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return self.__str__()
+
+class Replayer:
+    """Replays a recorded session against a fresh editor.
+
+    Latency is taken from the moment an event was due until the Output
+    texture has been replaced. With ``realtime`` the recorded timing is kept,
+    so slider events that fall due while an earlier one is still rendering
+    are coalesced into the newest value, like a busy UI thread would.
+
+    An event counts as dropped only when a render was expected, that is the
+    path ends at Output and an image is loaded, but the texture was not
+    replaced. Loads are replayed to rebuild the session but not timed, as
+    loading an image does not re-render Output. Snapshots, taken when
+    recording starts and on New/Open Project, restore the graph and are not
+    timed either. Events that raise are logged and counted as errors.
+    """
+
+    def __init__(self, events: List[Event], realtime: bool = True, viewport: bool = False):
+        self.events = events
+        self.realtime = realtime
+        self.viewport = viewport
+        self.editor = None
+
+    def _setup(self):
+        dpg.create_context()
+        update.path.clear()
+        update.node_links.clear()
+        update.timings.clear()
+        self.editor = PhotoGraphEditor()
+        with dpg.window(tag="photoGraphMain"):
+            self.editor._initialize()
+        if self.viewport:
+            dpg.create_viewport(title="PhotoGraph Replay", width=1200, height=800)
+            dpg.setup_dearpygui()
+
+    def _dispatch(self, event: Event):
+        if event.kind == "snapshot":
+            project.restore(self.editor, project.Project(**event.data))
+        elif event.kind == "load":
+            dpg.get_item_user_data("Input")._handle_file_selection(None, {"file_path_name": event.data["path"]})
+        elif event.kind == "link":
+            app_data = (resolve_ref(event.data["source"]), resolve_ref(event.data["target"]))
+            self.editor._on_link_created(self.editor.tag, app_data)
+        elif event.kind == "unlink":
+            source, target = resolve_ref(event.data["source"]), resolve_ref(event.data["target"])
+            link = next(link for link in update.node_links if link.source == source and link.target == target)
+            self.editor._on_link_deleted(self.editor.tag, link.id)
+        elif event.kind == "slider":
+            dpg.set_value(event.data["item"], event.data["value"])
+            update.update_output(event.data["item"], event.data["value"])
+        else:
+            raise ValueError(f"Unknown event kind: {event.kind}")
+        if self.viewport:
+            dpg.render_dearpygui_frame()
+
+    def _expects_render(self) -> bool:
+        return update.reaches_output() and dpg.get_item_user_data("Input").current_image is not None
+
+    def _supersedes(self, event: Event, following: Event, start: float) -> bool:
+        return (
+            self.realtime
+            and event.kind == following.kind == "slider"
+            and event.data["item"] == following.data["item"]
+            and start + following.time <= time.perf_counter()
+        )
+
+    def run(self) -> Report:
+        report = Report()
+        self._setup()
+        try:
+            output = dpg.get_item_user_data("Output")
+            start = time.perf_counter()
+            i = 0
+            while i < len(self.events):
+                event = self.events[i]
+                if self.realtime:
+                    time.sleep(max(0.0, start + event.time - time.perf_counter()))
+                pending = [event]
+                while i + 1 < len(self.events) and self._supersedes(event, self.events[i + 1], start):
+                    i += 1
+                    event = self.events[i]
+                    pending.append(event)
+                    report.coalesced += 1
+
+                dispatched = time.perf_counter()
+                texture = output.image
+                try:
+                    self._dispatch(event)
+                except Exception:
+                    logger.exception(f"Replaying {event} failed")
+                    report.errors += 1
+                    i += 1
+                    continue
+                done = time.perf_counter()
+
+                if event.kind == "snapshot":
+                    pass
+                elif event.kind == "load":
+                    report.loads += 1
+                elif output.image != texture:
+                    for event_ in pending:
+                        due = start + event_.time if self.realtime else dispatched
+                        report.add(event_.kind, done - due)
+                elif self._expects_render():
+                    report.dropped += 1
+                i += 1
+        finally:
+            dpg.destroy_context()
+        if not report.latencies:
+            logger.warning("No event in the script re-rendered Output, nothing was timed")
+        return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded PhotoGraph session and report latency.")
+    parser.add_argument("script", help="recorded session (.jsonl)")
+    parser.add_argument("--fast", action="store_true", help="ignore recorded timing and replay back to back")
+    parser.add_argument("--viewport", action="store_true", help="render each event into a hidden viewport")
+    args = parser.parse_args()
+
+    events = Recorder.load(args.script)
+    print(Replayer(events, realtime=not args.fast, viewport=args.viewport).run())
+
+if __name__ == "__main__":
+    main()